@@ -519,7 +519,7 @@ def show_workflow_progress():
         st.session_state.get('current_provider', ''),
         st.session_state.get('current_source_files', []),
         st.session_state.get('current_platform', ''),
-        len(st.session_state.generated_posts) > 0
+        bool(st.session_state.generated_posts)
     )
     
     # Display progress
@@ -716,6 +716,30 @@ Examples:
             'custom_instructions': st.session_state.custom_instructions
         }
 
+
+# Phase 5: CSV Export Helper Functions
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def build_csv_export(posts: tuple, platform: str, timestamp: datetime, include_metadata: bool = False):
+    """
+    Serialize posts to CSV, cached across reruns while posts are unchanged.
+    
+    The timestamp is written into every row and the filename, so the cached
+    result always matches its key. Callers truncate it to the minute so that
+    reruns within the same minute reuse the entry.
+    
+    Args:
+        posts: Tuple of edited posts (hashable cache key)
+        platform: Target platform name
+        timestamp: Export time, truncated to the minute
+        include_metadata: Whether to include additional metadata columns
+        
+    Returns:
+        tuple[str, str]: (csv_string, filename)
+    """
+    return create_csv_export(list(posts), platform, include_metadata=include_metadata, timestamp=timestamp)
+
+
 # Initialize session state
 initialize_session_state()
 
@@ -1207,9 +1231,11 @@ if st.session_state.generated_posts:
         
         # Generate CSV data for export
         try:
-            csv_string, filename = create_csv_export(
-                st.session_state.editing_posts,
+            export_ts = datetime.now().replace(second=0, microsecond=0)
+            csv_string, filename = build_csv_export(
+                tuple(st.session_state.editing_posts),
                 st.session_state.target_platform,
+                export_ts,
                 include_metadata=include_metadata
             )
             
@@ -1217,15 +1243,15 @@ if st.session_state.generated_posts:
             if show_preview:
                 st.markdown("### 📋 Export Preview")
                 
-                # Parse CSV to show preview
+                # Parse only the rows shown in the preview
                 import io
-                preview_df = pd.read_csv(io.StringIO(csv_string))
+                preview_df = pd.read_csv(io.StringIO(csv_string), nrows=5)
                 
                 # Show first few rows
-                st.dataframe(preview_df.head(min(5, len(preview_df))), use_container_width=True)
+                st.dataframe(preview_df, use_container_width=True)
                 
-                if len(preview_df) > 5:
-                    st.caption(f"Showing first 5 rows of {len(preview_df)} total rows")
+                if stats['valid_posts'] > 5:
+                    st.caption(f"Showing first 5 rows of {stats['valid_posts']} total rows")
             
             # Export buttons
             col1, col2, col3 = st.columns(3)
@@ -1262,9 +1288,10 @@ if st.session_state.generated_posts:
                 # Export with metadata button (if not already selected)
                 if not include_metadata:
                     try:
-                        csv_with_metadata, filename_metadata = create_csv_export(
-                            st.session_state.editing_posts,
+                        csv_with_metadata, filename_metadata = build_csv_export(
+                            tuple(st.session_state.editing_posts),
                             st.session_state.target_platform,
+                            export_ts,
                             include_metadata=True
                         )
                         
@@ -9,10 +9,12 @@ This module tests comprehensive testing scenarios including:
 """
 
 import pytest
+import csv
 import tempfile
 import time
-import sys
 import os
+import threading
+from collections import deque
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from io import BytesIO, StringIO
@@ -25,6 +27,23 @@ except ImportError:
     HAS_PSUTIL = False
     psutil = None
 
+# Unsafe filename characters (and spaces) mapped to underscores in one pass
+_SAFE_FN_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?* '})
+
+_CONTENT_VARIANTS = (
+    "Unix\nline\nendings",
+    "Windows\r\nline\r\nendings",
+    "Mac\rline\rendings",
+    "Mixed\nline\r\nendings\r"
+)
+
+_UNSAFE_NAMES = (
+    "file with spaces.csv",
+    "file:with:colons.csv",
+    "file/with/slashes.csv",
+    "file<with>brackets.csv"
+)
+
 
 class TestCompleteWorkflows:
     """Test complete workflows with all supported scenarios."""
@@ -694,17 +713,10 @@ Generate {count} posts.
             # Test line ending compatibility
             def test_line_endings():
                 """Test line ending compatibility."""
-                content_variants = [
-                    "Unix\nline\nendings",
-                    "Windows\r\nline\r\nendings",
-                    "Mac\rline\rendings",
-                    "Mixed\nline\r\nendings\r"
-                ]
-                
                 def normalize_line_endings(content):
                     return content.replace('\r\n', '\n').replace('\r', '\n')
                 
-                for content in content_variants:
+                for content in _CONTENT_VARIANTS:
                     normalized = normalize_line_endings(content)
                     assert '\r' not in normalized, f"Should normalize line endings: {content[:20]}"
             
@@ -744,22 +756,11 @@ Generate {count} posts.
             # Test filename safety
             def test_filename_safety():
                 """Test filename safety for different browsers."""
-                unsafe_names = [
-                    "file with spaces.csv",
-                    "file:with:colons.csv",
-                    "file/with/slashes.csv",
-                    "file<with>brackets.csv"
-                ]
-                
                 def make_filename_safe(filename):
-                    import re
-                    # Replace unsafe characters
-                    safe_name = re.sub(r'[<>:"/\\|?*]', '_', filename)
-                    # Replace spaces with underscores for maximum compatibility
-                    safe_name = safe_name.replace(' ', '_')
-                    return safe_name
-                
-                for unsafe_name in unsafe_names:
+                    # Replace unsafe characters and spaces for maximum compatibility
+                    return filename.translate(_SAFE_FN_TABLE)
+                
+                for unsafe_name in _UNSAFE_NAMES:
                     safe_name = make_filename_safe(unsafe_name)
                     assert not any(char in safe_name for char in '<>:"/\\|?*'), f"Should make filename safe: {unsafe_name}"
             
@@ -768,15 +769,15 @@ Generate {count} posts.
                 """Test content encoding for downloads."""
                 test_content = "Test content with special chars: áéíóú 🎉"
                 
-                # Test UTF-8 encoding
-                utf8_encoded = test_content.encode('utf-8')
-                utf8_decoded = utf8_encoded.decode('utf-8')
-                assert utf8_decoded == test_content, "Should handle UTF-8 encoding"
+                # Test UTF-8 encoding (34 ASCII + 5 two-byte accents + 4-byte emoji)
+                assert test_content.isprintable() and not test_content.isascii(), "Should contain printable non-ASCII text"
+                assert len(test_content.encode('utf-8')) == 48, "Should handle UTF-8 encoding"
                 
                 # Test CSV-safe content
                 csv_content = '"Text with, commas","Text with ""quotes"""\nRow 2, Column 2'
-                lines = csv_content.split('\n')
-                assert len(lines) >= 2, "Should handle CSV formatting"
+                rows = list(csv.reader(StringIO(csv_content)))
+                assert len(rows) >= 2, "Should handle CSV formatting"
+                assert rows[0] == ["Text with, commas", 'Text with "quotes"'], "Should unescape quoted fields"
             
             test_mime_types()
             test_filename_safety()
@@ -796,38 +797,41 @@ class TestPerformanceTesting:
         def test_processing_performance():
             """Test file processing performance metrics."""
             
-            # Create large test content
+            # Create large test content (no blank lines, raw throughput only)
             large_content = "Sample content line.\n" * 10000  # ~200KB
             
-            # Measure processing time
-            start_time = time.time()
+            # Small content with known blank lines to exercise the filter
+            sparse_content = "a\n\nb\n\n" * 250  # 1000 lines, half blank
             
             # Simulate text processing
             def process_text_content(content):
                 """Simulate text processing operations."""
-                # Split into lines
-                lines = content.split('\n')
-                
-                # Filter empty lines
-                non_empty_lines = [line for line in lines if line.strip()]
+                # Stream lines instead of materializing a split list
+                lines = (line.rstrip('\n') for line in StringIO(content))
                 
-                # Join back
-                processed = '\n'.join(non_empty_lines)
+                # Filter empty lines and join back
+                processed = '\n'.join(line for line in lines if line.strip())
                 
                 return processed
             
+            # Measure processing time
+            start_time = time.perf_counter_ns()
+            
             processed_content = process_text_content(large_content)
             
-            end_time = time.time()
-            processing_time = end_time - start_time
+            processing_time = (time.perf_counter_ns() - start_time) / 1e9
             
             # Performance assertions
             assert processing_time < 1.0, f"Large file processing should be fast: {processing_time:.2f}s"
-            assert len(processed_content) > 0, "Should produce processed content"
+            assert len(processed_content.replace('\n', '')) == len(large_content.replace('\n', '')), \
+                "Should keep all non-empty content"
+            
+            # Filter assertions on the small fixture
+            processed_sparse = process_text_content(sparse_content)
+            assert processed_sparse == '\n'.join(["a", "b"] * 250), "Should drop blank lines"
             
             # Memory usage test
-            import sys
-            content_size_mb = sys.getsizeof(processed_content) / 1024 / 1024
+            content_size_mb = len(processed_content) / 1024 / 1024
             assert content_size_mb < 10, f"Memory usage should be reasonable: {content_size_mb:.2f}MB"
             
             return processing_time
@@ -840,31 +844,22 @@ class TestPerformanceTesting:
         def test_concurrency_handling():
             """Test handling of concurrent operations."""
             
-            import threading
-            import queue
-            
-            # Simulate concurrent file processing
+            # Simulate concurrent file processing; deque append/popleft are
+            # atomic under the GIL, so no explicit locking is needed here
             def worker_function(work_queue, result_queue):
                 """Worker function for concurrent processing."""
-                while not work_queue.empty():
+                while True:
                     try:
-                        task = work_queue.get(timeout=1)
-                        
-                        # Simulate processing task
-                        result = f"Processed: {task}"
-                        result_queue.put(result)
-                        
-                        work_queue.task_done()
-                    except queue.Empty:
-                        break
-            
-            # Create work queue
-            work_queue = queue.Queue()
-            result_queue = queue.Queue()
-            
-            # Add tasks
-            for i in range(10):
-                work_queue.put(f"task_{i}")
+                        task = work_queue.popleft()
+                    except IndexError:
+                        return
+                    
+                    # Simulate processing task
+                    result_queue.append(f"Processed: {task}")
+            
+            # Create work queue with all tasks up front
+            work_queue = deque(f"task_{i}" for i in range(10))
+            result_queue = deque()
             
             # Create worker threads
             threads = []
@@ -878,9 +873,7 @@ class TestPerformanceTesting:
                 thread.join()
             
             # Collect results
-            results = []
-            while not result_queue.empty():
-                results.append(result_queue.get())
+            results = list(result_queue)
             
             assert len(results) == 10, "Should process all tasks concurrently"
             assert all("Processed:" in result for result in results), "All tasks should be processed"
@@ -911,15 +904,13 @@ class TestPerformanceTesting:
             def memory_intensive_operation():
                 """Simulate memory-intensive operation with cleanup."""
                 
-                # Create large data structure
-                large_data = []
-                for i in range(1000):
-                    large_data.append("x" * 1000)  # 1KB per item, 1MB total
+                # Create large data structure as 1KB views over one 1MB buffer
+                buffer = b"x" * 1_000_000
+                large_data = [memoryview(buffer)[i * 1000:(i + 1) * 1000] for i in range(1000)]
                 
-                # Process data
-                processed_data = []
-                for item in large_data:
-                    processed_data.append(item.upper())
+                # Process data once over the whole buffer, then re-slice
+                upper_buffer = buffer.upper()
+                processed_data = [memoryview(upper_buffer)[i * 1000:(i + 1) * 1000] for i in range(1000)]
                 
                 # Clean up large data
                 del large_data
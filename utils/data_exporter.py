@@ -1,59 +1,106 @@
-import pandas as pd
+import csv
+import io
 import re
 from datetime import datetime
-from typing import List, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 
-def create_csv_export(posts: List[str], platform: str, include_metadata: bool = False) -> Tuple[str, str]:
+CSV_HEADERS = ('post_text', 'generation_timestamp')
+METADATA_HEADERS = ('platform', 'post_number', 'character_count')
+FILENAME_TIMESTAMP_FORMAT = '%Y%m%dT%H%M%S%f'
+
+# Characters that force a CSV field to be quoted
+_CSV_SPECIAL_CHARS = (',', '"', '\n', '\r')
+
+# Invalid filename characters mapped to underscores in one translate pass
+_FILENAME_SANITIZE_TABLE = str.maketrans(dict.fromkeys('/\\:*?"<>| ', '_'))
+
+
+def create_csv_export(posts: Iterable[str], platform: str, include_metadata: bool = False,
+                      timestamp: Optional[datetime] = None) -> Tuple[str, str]:
     """
     Create CSV export of generated posts.
     
     Args:
-        posts: List of final edited posts
+        posts: Final edited posts (any iterable, consumed once)
         platform: Target platform name
         include_metadata: Whether to include additional metadata columns
+        timestamp: Export time shared by every row and the filename (defaults to now)
         
     Returns:
         tuple[str, str]: (csv_string, filename)
     """
-    # Generate timestamp for export
-    export_timestamp = datetime.now().isoformat()
+    # Generate one timestamp shared by every row and the filename
+    now = timestamp if timestamp is not None else datetime.now()
+    export_timestamp = now.isoformat()
     
     # Sanitize and validate posts
     sanitized_posts = _sanitize_posts(posts)
     
-    # Create base DataFrame with required columns
-    data = {
-        'post_text': sanitized_posts,
-        'generation_timestamp': [export_timestamp] * len(sanitized_posts)
-    }
+    if not include_metadata and not any(_needs_quoting(post) for post in sanitized_posts):
+        # Fast path: no field needs quoting, so rows can be joined directly
+        csv_string = ','.join(CSV_HEADERS) + '\n' + ''.join(
+            f"{post},{export_timestamp}\n" for post in sanitized_posts
+        )
+    else:
+        csv_string = _write_csv(sanitized_posts, platform, export_timestamp, include_metadata)
     
-    # Add optional metadata columns
-    if include_metadata:
-        data.update({
-            'platform': [platform] * len(sanitized_posts),
-            'post_number': list(range(1, len(sanitized_posts) + 1)),
-            'character_count': [len(post) for post in sanitized_posts]
-        })
+    # Generate dynamic filename
+    filename = _generate_filename(platform, now)
     
-    # Create DataFrame
-    df = pd.DataFrame(data)
+    return csv_string, filename
+
+
+def _write_csv(posts: List[str], platform: str, timestamp: str, include_metadata: bool) -> str:
+    """
+    Write posts with the stdlib CSV writer, quoting fields as needed.
     
-    # Convert to CSV string with proper encoding
-    csv_string = df.to_csv(index=False, encoding='utf-8')
+    Args:
+        posts: List of sanitized posts
+        platform: Target platform name
+        timestamp: ISO timestamp shared by every row
+        include_metadata: Whether to include additional metadata columns
+        
+    Returns:
+        CSV content string
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
     
-    # Generate dynamic filename
-    filename = _generate_filename(platform, export_timestamp)
+    if include_metadata:
+        # Add optional metadata columns
+        writer.writerow(CSV_HEADERS + METADATA_HEADERS)
+        writer.writerows(
+            (post, timestamp, platform, number, len(post))
+            for number, post in enumerate(posts, 1)
+        )
+    else:
+        writer.writerow(CSV_HEADERS)
+        writer.writerows((post, timestamp) for post in posts)
+    
+    return buffer.getvalue()
+
+
+def _needs_quoting(value: str) -> bool:
+    """
+    Check whether a CSV field contains a delimiter, quote or line break.
     
-    return csv_string, filename
+    Args:
+        value: Field content
+        
+    Returns:
+        True if the field must be quoted
+    """
+    # Single-character substring search is memchr-backed in CPython
+    return any(char in value for char in _CSV_SPECIAL_CHARS)
 
 
-def _sanitize_posts(posts: List[str]) -> List[str]:
+def _sanitize_posts(posts: Iterable[str]) -> List[str]:
     """
     Sanitize posts for CSV export safety.
     
     Args:
-        posts: List of raw posts
+        posts: Iterable of raw posts
         
     Returns:
         List of sanitized posts
@@ -121,13 +168,13 @@ def _sanitize_csv_content(content: str) -> str:
     return content
 
 
-def _generate_filename(platform: str, timestamp: str) -> str:
+def _generate_filename(platform: str, timestamp: datetime) -> str:
     """
     Generate dynamic filename following the convention.
     
     Args:
         platform: Target platform name
-        timestamp: ISO timestamp string
+        timestamp: Export time
         
     Returns:
         Sanitized filename string
@@ -135,8 +182,8 @@ def _generate_filename(platform: str, timestamp: str) -> str:
     # Sanitize platform name for filename
     safe_platform = _sanitize_platform_name(platform)
     
-    # Format timestamp for filename (remove colons and microseconds)
-    safe_timestamp = timestamp.split('.')[0].replace(':', '-')
+    # Compact, filesystem-safe timestamp (no colons) in a single strftime call
+    safe_timestamp = timestamp.strftime(FILENAME_TIMESTAMP_FORMAT)
     
     return f"posts_for_{safe_platform}_{safe_timestamp}.csv"
 
@@ -152,11 +199,7 @@ def _sanitize_platform_name(platform: str) -> str:
         Sanitized platform name
     """
     # Replace invalid filename characters with underscores
-    invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|', ' ']
-    sanitized = platform
-    
-    for char in invalid_chars:
-        sanitized = sanitized.replace(char, '_')
+    sanitized = platform.translate(_FILENAME_SANITIZE_TABLE)
     
     # Remove any remaining problematic characters
     sanitized = re.sub(r'[^\w\-_.]', '_', sanitized)